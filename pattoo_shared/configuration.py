@@ -4,6 +4,8 @@
 # Standard imports
 import os
 import stat
+import copy
+import functools
 
 # Import project libraries
 from pattoo_shared import files
@@ -13,6 +15,15 @@ from pattoo_shared.constants import (
     PATTOO_API_AGENT_PREFIX)
 from pattoo_shared.variables import PollingPoint
 
+# Agent API URIs
+_AGENT_API_URI = '{}/receive'.format(PATTOO_API_AGENT_PREFIX)
+_AGENT_API_KEY_URI = '{}/key'.format(PATTOO_API_AGENT_PREFIX)
+_AGENT_API_VALIDATION_URI = '{}/validation'.format(PATTOO_API_AGENT_PREFIX)
+_AGENT_API_ENCRYPTED_URI = '{}/encrypted'.format(PATTOO_API_AGENT_PREFIX)
+
+# Directories already known to exist
+_ENSURED_DIRECTORIES = set()
+
 
 def _config_reader(filename):
     """Read a configuration file.
@@ -25,10 +36,142 @@ def _config_reader(filename):
 
     """
     # Get the configuration directory
+    config_directory = _config_dir()
+    config_file = os.path.join(config_directory, filename)
+
+    # Use the cached contents if the file hasn't changed since the last read.
+    # Let files.read_yaml_file report the error if the file can't be found.
+    try:
+        file_stat = os.stat(config_file)
+    except OSError:
+        config_dict = files.read_yaml_file(config_file)
+    else:
+        # Copy the cached value so that changes made by one instance don't
+        # affect the others
+        config_dict = copy.deepcopy(_load_config_cached(
+            config_file, file_stat.st_mtime_ns, file_stat.st_size))
+    return config_dict
+
+
+def _config_dir():
+    """Get the expanded configuration directory.
+
+    Args:
+        None
+
+    Returns:
+        result: Configuration directory
+
+    """
+    # Let log.check_environment set the default if the variable isn't set.
+    # Otherwise the result only changes when $PATTOO_CONFIGDIR does
+    environment = os.environ.get('PATTOO_CONFIGDIR')
+    if environment is None:
+        environment = log.check_environment()
+    result = _expanded_config_dir(environment)
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _expanded_config_dir(environment):
+    """Validate and expand the configuration directory, caching the result.
+
+    Use _expanded_config_dir.cache_clear() to empty the cache.
+
+    Args:
+        environment: Value of the $PATTOO_CONFIGDIR environment variable
+
+    Returns:
+        result: Configuration directory
+
+    """
+    # Verify configuration directory
+    log.check_config_directory(environment)
+
     # Expand linux ~ notation for home directories if provided.
-    _config_directory = log.check_environment()
-    config_directory = os.path.expanduser(_config_directory)
-    config_file = '{}{}{}'.format(config_directory, os.sep, filename)
+    result = os.path.expanduser(environment)
+    return result
+
+
+def _flatten(config_dict):
+    """Create a dict for looking up configuration values in one step.
+
+    Args:
+        config_dict: Dict representation of YAML in a configuration file
+
+    Returns:
+        result: Dict of values keyed by (key, sub_key) tuples. None if
+            config_dict is not a dict
+
+    """
+    # Verify config_dict is indeed a dict once. lookup() dies only if a
+    # value is requested from an invalid configuration file
+    if not isinstance(config_dict, dict):
+        return None
+
+    # Flatten the secondary keys
+    result = {}
+    for key, value in config_dict.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                result[(key, sub_key)] = sub_value
+    return result
+
+
+def _ensure_dir(directory):
+    """Create a directory if it hasn't already been created or verified.
+
+    Args:
+        directory: Directory name
+
+    Returns:
+        None
+
+    """
+    # Only check the filesystem the first time
+    if directory in _ENSURED_DIRECTORIES:
+        return
+    files.mkdir(directory)
+    _ENSURED_DIRECTORIES.add(directory)
+
+
+@functools.lru_cache(maxsize=16)
+def _url_ip_address(ip_address):
+    """Adjust address for IPv6 if necessary, caching the result.
+
+    url.url_ip_address only parses the address and doesn't do DNS lookups,
+    so the result never goes stale.
+
+    Args:
+        ip_address: IP address / hostname
+
+    Returns:
+        result: Fixed address for polling
+
+    """
+    # Return
+    result = url.url_ip_address(ip_address)
+    return result
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_file, mtime_ns, size):
+    """Read a configuration file, caching the result.
+
+    The modification time and size of the file are part of the cache key so
+    that changes to the file are picked up on the next read. Use
+    _load_config_cached.cache_clear() to empty the cache.
+
+    Args:
+        config_file: Name of file to read
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        config_dict: Dict representation of YAML in the file
+
+    """
+    # Read data
     config_dict = files.read_yaml_file(config_file)
     return config_dict
 
@@ -48,6 +191,13 @@ class BaseConfig():
         """
         # Read data
         self._base_yaml_configuration = _config_reader('pattoo.yaml')
+        self._base_lookup = _flatten(self._base_yaml_configuration)
+
+        # Values derived from the configuration, populated on first use
+        self._log_directory = None
+        self._log_file = None
+        self._log_file_api = None
+        self._log_file_daemon = None
 
     def config_directory(self):
         """Get config_directory.
@@ -73,26 +223,31 @@ class BaseConfig():
             result: result
 
         """
+        # Return the previously verified value
+        if self._log_directory is not None:
+            return self._log_directory
+
         # Get result
         sub_key = 'log_directory'
         result = None
         key = 'pattoo'
 
         # Get new result
-        _result = search(key, sub_key, self._base_yaml_configuration)
+        _result = lookup(key, sub_key, self._base_lookup)
 
         # Expand linux ~ notation for home directories if provided.
         result = os.path.expanduser(_result)
 
         # Check if value exists. We cannot use log2die_safe as it does not
         # require a log directory location to work properly
-        if os.path.isdir(result) is False:
+        if not os.path.isdir(result):
             log_message = (
                 'log_directory: "{}" '
                 'in configuration doesn\'t exist!'.format(result))
             log.log2die_safe(1003, log_message)
 
         # Return
+        self._log_directory = result
         return result
 
     def log_file(self):
@@ -105,8 +260,10 @@ class BaseConfig():
             result: result
 
         """
-        _log_directory = self.log_directory()
-        result = '{}{}pattoo.log'.format(_log_directory, os.sep)
+        if self._log_file is None:
+            _log_directory = self.log_directory()
+            self._log_file = os.path.join(_log_directory, 'pattoo.log')
+        result = self._log_file
         return result
 
     def log_file_api(self):
@@ -120,8 +277,11 @@ class BaseConfig():
 
         """
         # Get result
-        _log_directory = self.log_directory()
-        result = '{}{}pattoo-api.log'.format(_log_directory, os.sep)
+        if self._log_file_api is None:
+            _log_directory = self.log_directory()
+            self._log_file_api = os.path.join(
+                _log_directory, 'pattoo-api.log')
+        result = self._log_file_api
         return result
 
     def log_file_daemon(self):
@@ -135,8 +295,11 @@ class BaseConfig():
 
         """
         # Get result
-        _log_directory = self.log_directory()
-        result = '{}{}pattoo-daemon.log'.format(_log_directory, os.sep)
+        if self._log_file_daemon is None:
+            _log_directory = self.log_directory()
+            self._log_file_daemon = os.path.join(
+                _log_directory, 'pattoo-daemon.log')
+        result = self._log_file_daemon
         return result
 
     def log_level(self):
@@ -155,8 +318,8 @@ class BaseConfig():
         result = None
 
         # Return
-        intermediate = search(
-            key, sub_key, self._base_yaml_configuration, die=False)
+        intermediate = lookup(
+            key, sub_key, self._base_lookup, die=False)
         if intermediate is None:
             result = 'debug'
         else:
@@ -178,13 +341,13 @@ class BaseConfig():
         sub_key = 'cache_directory'
 
         # Get result
-        _value = search(key, sub_key, self._base_yaml_configuration)
+        _value = lookup(key, sub_key, self._base_lookup)
 
         # Expand linux ~ notation for home directories if provided.
         value = os.path.expanduser(_value)
 
         # Create directory if it doesn't exist
-        files.mkdir(value)
+        _ensure_dir(value)
 
         # Return
         return value
@@ -200,10 +363,10 @@ class BaseConfig():
 
         """
         # Get result
-        result = '{}/{}'.format(self.cache_directory(), agent_program)
+        result = os.path.join(self.cache_directory(), str(agent_program))
 
         # Create directory if it doesn't exist
-        files.mkdir(result)
+        _ensure_dir(result)
 
         # Return
         return result
@@ -223,13 +386,13 @@ class BaseConfig():
         sub_key = 'daemon_directory'
 
         # Get result
-        _value = search(key, sub_key, self._base_yaml_configuration)
+        _value = lookup(key, sub_key, self._base_lookup)
 
         # Expand linux ~ notation for home directories if provided.
         value = os.path.expanduser(_value)
 
         # Create directory if it doesn't exist
-        files.mkdir(value)
+        _ensure_dir(value)
 
         # Return
         return value
@@ -295,14 +458,14 @@ class BaseConfig():
         sub_key = 'system_daemon_directory'
 
         # Get result
-        result = search(key, sub_key, self._base_yaml_configuration, die=False)
-        _value = result if bool(result) else self.daemon_directory()
+        result = lookup(key, sub_key, self._base_lookup, die=False)
+        _value = result or self.daemon_directory()
 
         # Expand linux ~ notation for home directories if provided.
         value = os.path.expanduser(_value)
 
         # Create directory if it doesn't exist
-        files.mkdir(value)
+        _ensure_dir(value)
 
         # Return
         return value
@@ -320,11 +483,11 @@ class BaseConfig():
         # Get result
         key = 'pattoo'
         sub_key = 'language'
-        intermediate = search(
-            key, sub_key, self._base_yaml_configuration, die=False)
+        intermediate = lookup(
+            key, sub_key, self._base_lookup, die=False)
 
         # Default to 'en'
-        if bool(intermediate) is False:
+        if not intermediate:
             result = 'en'
         else:
             result = str(intermediate).lower()
@@ -347,6 +510,7 @@ class ServerConfig(BaseConfig):
         # Get the configuration
         BaseConfig.__init__(self)
         self._server_yaml_configuration = _config_reader('pattoo_server.yaml')
+        self._server_lookup = _flatten(self._server_yaml_configuration)
 
 
 class Config(BaseConfig):
@@ -366,6 +530,7 @@ class Config(BaseConfig):
         BaseConfig.__init__(self)
 
         self._agent_yaml_configuration = _config_reader('pattoo_agent.yaml')
+        self._agent_lookup = _flatten(self._agent_yaml_configuration)
 
     def agent_api_ip_address(self):
         """Get api_ip_address.
@@ -382,8 +547,8 @@ class Config(BaseConfig):
         sub_key = 'ip_address'
 
         # Get result
-        result = search(
-            key, sub_key, self._agent_yaml_configuration, die=False)
+        result = lookup(
+            key, sub_key, self._agent_lookup, die=False)
         if result is None:
             result = 'localhost'
         return result
@@ -403,8 +568,8 @@ class Config(BaseConfig):
         sub_key = 'ip_bind_port'
 
         # Get result
-        intermediate = search(
-            key, sub_key, self._agent_yaml_configuration, die=False)
+        intermediate = lookup(
+            key, sub_key, self._agent_lookup, die=False)
         if intermediate is None:
             result = 20201
         else:
@@ -422,7 +587,7 @@ class Config(BaseConfig):
 
         """
         # Return
-        result = '{}/receive'.format(PATTOO_API_AGENT_PREFIX)
+        result = _AGENT_API_URI
         return result
 
     def agent_api_key(self):
@@ -434,7 +599,7 @@ class Config(BaseConfig):
         Returns:
             url (str): URL of the key exchange point
         """
-        url_ = '{}/key'.format(PATTOO_API_AGENT_PREFIX)
+        url_ = _AGENT_API_KEY_URI
         return url_
 
     def agent_api_validation(self):
@@ -446,7 +611,7 @@ class Config(BaseConfig):
         Returns:
             url (str): URL of the validation point
         """
-        url_ = '{}/validation'.format(PATTOO_API_AGENT_PREFIX)
+        url_ = _AGENT_API_VALIDATION_URI
         return url_
 
     def agent_api_encrypted(self):
@@ -460,7 +625,7 @@ class Config(BaseConfig):
 
         """
         # Return
-        result = '{}/encrypted'.format(PATTOO_API_AGENT_PREFIX)
+        result = _AGENT_API_ENCRYPTED_URI
         return result
 
     def agent_api_server_url(self, agent_id):
@@ -474,7 +639,7 @@ class Config(BaseConfig):
 
         """
         # Return
-        _ip = url.url_ip_address(self.agent_api_ip_address())
+        _ip = _url_ip_address(self.agent_api_ip_address())
         result = (
             'http://{}:{}{}/{}'.format(
                 _ip,
@@ -493,7 +658,7 @@ class Config(BaseConfig):
 
         """
         # Initialize key variables
-        _ip = url.url_ip_address(self.agent_api_ip_address())
+        _ip = _url_ip_address(self.agent_api_ip_address())
         link = (
             'http://{}:{}{}'.format(
                 _ip,
@@ -515,7 +680,7 @@ class Config(BaseConfig):
 
         """
 
-        _ip = url.url_ip_address(self.agent_api_ip_address())
+        _ip = _url_ip_address(self.agent_api_ip_address())
         link = (
             'http://{}:{}{}'.format(
                 _ip,
@@ -537,7 +702,7 @@ class Config(BaseConfig):
 
         """
 
-        _ip = url.url_ip_address(self.agent_api_ip_address())
+        _ip = _url_ip_address(self.agent_api_ip_address())
         link = (
             'http://{}:{}{}'.format(
                 _ip,
@@ -560,10 +725,8 @@ def agent_config_filename(agent_program):
 
     """
     # Get the configuration directory
-    # Expand linux ~ notation for home directories if provided.
-    _config_directory = log.check_environment()
-    config_directory = os.path.expanduser(_config_directory)
-    result = '{}{}{}.yaml'.format(config_directory, os.sep, agent_program)
+    config_directory = _config_dir()
+    result = os.path.join(config_directory, '{}.yaml'.format(agent_program))
     return result
 
 
@@ -577,31 +740,49 @@ def get_polling_points(_data):
         results: List of PollingPoint objects
 
     """
-    # Start conversion
-    results = []
+    # Reject non list data
+    if not isinstance(_data, list):
+        return []
+
+    # Convert dicts with an address, using the default multiplier if needed
+    _polling_point = PollingPoint
+    results = [
+        _polling_point(
+            address=item['address'], multiplier=item.get('multiplier', 1))
+        for item in _data if isinstance(item, dict) and 'address' in item]
 
-    if isinstance(_data, list) is True:
-        # Cycle through list
-        for item in _data:
-            # Reject non dict data
-            if isinstance(item, dict) is False:
-                continue
+    # Return
+    return results
 
-            # Assign address value only if present
-            if 'address' in item:
-                address = item['address']
-            else:
-                continue
 
-            # Assign replacement multiplier
-            multiplier = item.get('multiplier', 1)
+def lookup(key, sub_key, lookup_dict, die=True):
+    """Get config parameter from a dict created by _flatten.
 
-            # Populate result
-            result = PollingPoint(address=address, multiplier=multiplier)
-            results.append(result)
+    Args:
+        key: Primary key
+        sub_key: Secondary key
+        lookup_dict: Dict keyed by (key, sub_key) tuples
+        die: Die if true and the result encountered is None
+
+    Returns:
+        result: result
+
+    """
+    # Die safely as log_directory is not defined
+    if lookup_dict is None:
+        log.log2die_safe(1102, 'Invalid configuration file. YAML not found')
+
+    # Get result
+    result = lookup_dict.get((key, sub_key))
+
+    # Error if not configured
+    if result is None and die:
+        log_message = (
+            '{}:{} not defined in configuration'.format(key, sub_key))
+        log.log2die_safe(1107, log_message)
 
     # Return
-    return results
+    return result
 
 
 def search(key, sub_key, config_dict, die=True):
@@ -622,7 +803,7 @@ def search(key, sub_key, config_dict, die=True):
 
     # Verify config_dict is indeed a dict.
     # Die safely as log_directory is not defined
-    if isinstance(config_dict, dict) is False:
+    if not isinstance(config_dict, dict):
         log.log2die_safe(1021, 'Invalid configuration file. YAML not found')
 
     # Get new result
@@ -637,7 +818,7 @@ def search(key, sub_key, config_dict, die=True):
         result = config_dict[key].get(sub_key)
 
     # Error if not configured
-    if result is None and die is True:
+    if result is None and die:
         log_message = (
             '{}:{} not defined in configuration dict {}'.format(
                                                     key, sub_key, config_dict))
@@ -34,13 +34,11 @@ AGENT_METADATA_KEYS = (
     'pattoo_agent_id', 'pattoo_agent_polled_target', 'pattoo_agent_program',
     'pattoo_agent_hostname', 'pattoo_agent_polling_interval')
 
-# Create reserved keys
-_ = list(DATAPOINT_KEYS)
-_.extend(AGENT_METADATA_KEYS)
-RESERVED_KEYS = tuple(_)
+# Create reserved keys. Use RESERVED_KEYS_SET for membership tests
+RESERVED_KEYS = DATAPOINT_KEYS + AGENT_METADATA_KEYS
+RESERVED_KEYS_SET = frozenset(RESERVED_KEYS)
 
-PattooDBrecord = collections.namedtuple(
-    'PattooDBrecord', ' '.join(RESERVED_KEYS))
+PattooDBrecord = collections.namedtuple('PattooDBrecord', RESERVED_KEYS)
 
 # Keys of posted cached data. Based on keys in
 # pattoo_shared.constants.PostingDataPoints
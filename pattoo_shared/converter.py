@@ -10,8 +10,8 @@ from .variables import (
     PostingDataPoints)
 from .constants import (
     DATA_FLOAT, DATA_INT, DATA_COUNT64, DATA_COUNT, DATA_STRING, DATA_NONE,
-    MAX_KEYPAIR_LENGTH, PattooDBrecord, RESERVED_KEYS, CACHE_KEYS,
-    AGENT_METADATA_KEYS)
+    MAX_KEYPAIR_LENGTH, PattooDBrecord, RESERVED_KEYS, RESERVED_KEYS_SET,
+    CACHE_KEYS, AGENT_METADATA_KEYS)
 from pattoo_shared import data
 from pattoo_shared import log
 
@@ -392,7 +392,7 @@ def _keypairs(_data):
     for _key, value in _data.items():
         # We want to make sure that we don't have
         # duplicate key-value pairs
-        if _key in RESERVED_KEYS:
+        if _key in RESERVED_KEYS_SET:
             continue
         # Key-Value pairs must be strings
         if isinstance(_key, str) is False or isinstance(
@@ -16,6 +16,9 @@ import yaml
 from pattoo_shared import log
 from pattoo_shared import data
 
+# Use the libyaml based loader when PyYAML has been built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class _Directory():
     """A class for creating the names of hidden directories."""
@@ -154,7 +157,7 @@ def read_yaml_files(config_directory):
     # Initialize key variables
     yaml_found = False
     yaml_from_file = ''
-    all_yaml_read = ''
+    yaml_read = []
 
     if os.path.isdir(config_directory) is False:
         log_message = (
@@ -174,7 +177,7 @@ def read_yaml_files(config_directory):
             yaml_from_file = read_yaml_file(filepath, as_string=True, die=True)
 
             # Append yaml from file to all yaml previously read
-            all_yaml_read = '{}\n{}'.format(all_yaml_read, yaml_from_file)
+            yaml_read.append(yaml_from_file)
 
     # Verify YAML files found in directory. We cannot use logging as it
     # requires a logfile location from the configuration directory to work
@@ -185,8 +188,9 @@ def read_yaml_files(config_directory):
             'extension.'.format(config_directory))
         log.log2die_safe(1015, log_message)
 
-    # Return
-    config_dict = yaml.safe_load(all_yaml_read)
+    # Return. Join once instead of growing a string per file
+    all_yaml_read = '\n'.join(yaml_read)
+    config_dict = yaml.load(all_yaml_read, Loader=_YAML_LOADER)
     return config_dict
 
 
@@ -227,7 +231,7 @@ def read_yaml_file(filepath, as_string=False, die=True):
         # Get result
         if as_string is False:
             try:
-                result = yaml.safe_load(yaml_from_file)
+                result = yaml.load(yaml_from_file, Loader=_YAML_LOADER)
             except:
                 log_message = (
                     'Error reading file {}. Check permissions, '
@@ -12,6 +12,10 @@ import yaml
 from pattoo_shared import files, log
 from pattoo_shared.installation import shared
 
+# Use the libyaml based loader and dumper when PyYAML has been built with them
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 def create_user(user_name, directory, shell, verbose):
     """Create user and their respective group.
@@ -68,11 +72,13 @@ def read_config(filepath, default_config):
         default_config: Default configuration dict
 
     Returns:
-        config: Dict of configuration
+        config: Dict of configuration. Values in the file take priority
+            over those in default_config. Defaults missing from the file
+            are added. default_config is returned if the file doesn't exist
 
     """
     # Read config
-    if os.path.isfile(filepath) is True:
+    if os.path.isfile(filepath):
         try:
             f_handle = open(filepath, 'r')
         except PermissionError:
@@ -80,18 +86,10 @@ def read_config(filepath, default_config):
 Insufficient permissions for reading the file:{}'''.format(filepath))
         else:
             with f_handle:
-                yaml_string = f_handle.read()
-                config = yaml.safe_load(yaml_string)
-
-        # Find and replace dictionary values
-        # for default_key, default_value in default_config.items():
-        #     if isinstance(default_value, dict)
-        #     for key in config:
-        #         if key == default_key:
-        #             config[key] = default_config.get(default_key)
-        #     # Add new entries to config dict if they aren't in the file
-        #     if default_key not in config:
-        #         config[default_key] = default_config.get(default_key)
+                file_config = yaml.load(f_handle, Loader=_YAML_LOADER) or {}
+
+        # Replace default values with those found in the file
+        config = _deep_merge(default_config, file_config)
 
     else:
         config = default_config
@@ -99,13 +97,37 @@ Insufficient permissions for reading the file:{}'''.format(filepath))
     return config
 
 
-def check_config(config_file, config_dict):
+def _deep_merge(base, overlay):
+    """Merge the values of one dict on top of another.
+
+    Args:
+        base: Dict of default values
+        overlay: Dict of values that replace those in base
+
+    Returns:
+        result: Merged dict. base and overlay are not modified
+
+    """
+    # Initialize key variables
+    result = dict(base)
+
+    # Merge nested dicts, replace everything else
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def check_config(config_file, config_dict, loaded=None):
     """Ensure agent configuration exists.
 
     Args:
         config: The name of the configuration file
         config_dict: A dictionary containing the primary configuration keys
         and a list of the secondary keys
+        loaded: Configuration already read from config_file, if available
 
     Returns:
         None
@@ -118,20 +140,57 @@ def check_config(config_file, config_dict):
     print('??: Checking configuration parameters.')
 
     # Retrieve config dict
-    config = files.read_yaml_file(config_file)
+    if loaded is None:
+        config = files.read_yaml_file(config_file)
+    else:
+        config = loaded
 
     # Check main keys
-    for primary in config_dict.keys():
-        if primary not in config:
+    missing = config_dict.keys() - config.keys()
+    if missing:
+        log_message = ('''\
+Sections {} not found in configuration file {} in directory {}. Please fix.\
+    '''.format(_quoted(missing), config_file, config_directory))
+        log.log2die_safe(1055, log_message)
+
+    # Check secondary keys
+    for primary, secondaries in config_dict.items():
+        # Secondary keys may be given as a dict or a list
+        if not isinstance(secondaries, (dict, list, tuple, set)):
+            continue
+
+        # Every parameter is missing if the section has no values
+        configured = config[primary]
+        if not isinstance(configured, dict):
+            configured = {}
+        missing = set(secondaries) - set(configured)
+        if missing:
             log_message = ('''\
-Section "{}" not found in configuration file {} in directory {}. Please fix.\
-    '''.format(primary, config_file, config_directory))
-            log.log2die_safe(1055, log_message)
+Parameters {} in section "{}" not found in configuration file {} in \
+directory {}. Please fix.'''.format(_quoted(missing), primary, config_file,
+                                    config_directory))
+            log.log2die_safe(1108, log_message)
 
     # Print Status
     print('OK: Configuration parameter check passed.')
 
 
+def _quoted(keys):
+    """Create a sorted, quoted and comma separated string of keys.
+
+    Args:
+        keys: Iterable of configuration keys
+
+    Returns:
+        result: String of keys
+
+    """
+    # Sort as strings as YAML keys may be of mixed types
+    result = ', '.join(
+        '"{}"'.format(key) for key in sorted(keys, key=str))
+    return result
+
+
 def user_exists(user_name):
     """Check if the user already exists.
 
@@ -161,6 +220,24 @@ def pattoo_config(file_name, config_directory, config_dict):
     Returns:
         The path to the configuration file
 
+    """
+    # Create configuration
+    config_file, _ = _pattoo_config(file_name, config_directory, config_dict)
+    return config_file
+
+
+def _pattoo_config(file_name, config_directory, config_dict):
+    """Create configuration file.
+
+    Args:
+        file_name: Name of the configuration file without its file extension
+        config_directory: Full path to the configuration directory
+        config_dict: A dictionary containing the configuration values.
+
+    Returns:
+        result: Tuple of (path to the configuration file, configuration
+            written to the file)
+
     """
     # Initialize key variables
     config_file = os.path.join(config_directory, '{}.yaml'.format(file_name))
@@ -172,41 +249,137 @@ def pattoo_config(file_name, config_directory, config_dict):
     config = read_config(config_file, config_dict)
 
     # Check validity of directories, if any
-    if bool(config) is False:
+    if not config:
         # Set default
         config = config_dict
 
-    # Iterate over config dict
+    # Get the directories in the configuration, if any
+    directories = []
     for _, value in sorted(config.items()):
-        if isinstance(value, dict) is True:
+        if isinstance(value, dict):
             for secondary_key in value.keys():
                 if 'directory' in secondary_key:
                     if os.sep not in value.get(secondary_key):
                         log.log2die_safe(
                             1019, '{} is an invalid directory'.format(value))
+                    directories.append(
+                        os.path.expanduser(value.get(secondary_key)))
+
+    # Attempt to create directories
+    existing = _existing_directories(directories)
+    created = set()
+    for full_directory in directories:
+        path = os.path.normpath(full_directory)
+        if full_directory not in existing and path not in created:
+            print('Creating: {}'.format(full_directory))
+            files.mkdir(full_directory)
+            created.add(path)
+
+    # Recursively set file ownership to pattoo user and group
+    if getpass.getuser() == 'root':
+        for full_directory in _chown_roots(directories):
+            shared.chown(full_directory)
+
+    # Write file
+    try:
+        f_handle = open(config_file, 'w')
+    except PermissionError:
+        log.log2die(1076, '''\
+Insufficient permissions for creating the file:{}'''.format(config_file))
+    else:
+        with f_handle:
+            yaml.dump(
+                config, f_handle, Dumper=_YAML_DUMPER,
+                default_flow_style=False)
+
+    result = (config_file, config)
+    return result
+
+
+def _existing_directories(directories):
+    """Determine which directories already exist.
+
+    Directories are grouped by parent so that each parent is only scanned
+    once, instead of running os.path.isdir on every directory.
 
-                    # Attempt to create directory
-                    full_directory = os.path.expanduser(
-                        value.get(secondary_key))
-                    if os.path.isdir(full_directory) is False:
-                        print('Creating: {}'.format(full_directory))
-                        files.mkdir(full_directory)
+    Args:
+        directories: List of directories
+
+    Returns:
+        result: Set of directories that exist
 
-                    # Recursively set file ownership to pattoo user and group
-                    if getpass.getuser() == 'root':
-                        shared.chown(full_directory)
+    """
+    # Initialize key variables
+    result = set()
+    parents = {}
 
-        # Write file
+    # Group directories by parent
+    for directory in directories:
+        parent, name = os.path.split(os.path.normpath(directory))
+
+        # Scanning never lists these names, so check them directly
+        if name in ('', os.curdir, os.pardir):
+            if os.path.isdir(directory):
+                result.add(directory)
+            continue
+
+        parents.setdefault(parent or os.curdir, {}).setdefault(
+            name, []).append(directory)
+
+    # Scan each parent
+    for parent, children in parents.items():
         try:
-            f_handle = open(config_file, 'w')
-        except PermissionError:
-            log.log2die(1076, '''\
-Insufficient permissions for creating the file:{}'''.format(config_file))
-        else:
-            with f_handle:
-                yaml.dump(config, f_handle, default_flow_style=False)
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name in children and entry.is_dir():
+                        result.update(children[entry.name])
+        except OSError:
+            # The parent doesn't exist, so neither do its children
+            continue
 
-    return config_file
+    return result
+
+
+def _chown_roots(directories):
+    """Get the directories that need to be passed to shared.chown.
+
+    shared.chown is recursive, so directories that are duplicates of, or
+    inside, another directory it will change can be skipped. Real paths are
+    compared as os.walk doesn't follow symlinks below the directory it
+    starts from. Common parents outside the list are never used, as that
+    would change the ownership of unrelated files.
+
+    Args:
+        directories: List of directories
+
+    Returns:
+        result: List of directories
+
+    """
+    # Initialize key variables
+    result = []
+    roots = []
+    marker = '{}pattoo'.format(os.sep)
+
+    # Resolve each directory once
+    real_paths = {
+        directory: os.path.realpath(directory) for directory in directories}
+
+    # Shorter paths first so that parents are found before their children
+    for directory in sorted(
+            real_paths,
+            key=lambda directory: (len(real_paths[directory]), directory)):
+        path = real_paths[directory]
+        if any(path == root or path.startswith(
+                '{}{}'.format(root.rstrip(os.sep), os.sep)) for root in roots):
+            continue
+
+        # shared.chown only changes directories with the marker in the name
+        if marker in directory:
+            roots.append(path)
+        result.append(directory)
+
+    return result
 
 
 def configure_component(component_name, config_dir, config_dict):
@@ -221,7 +394,8 @@ def configure_component(component_name, config_dir, config_dict):
         None
     """
     # Create configuration
-    config_file = pattoo_config(component_name, config_dir, config_dict)
+    config_file, config = _pattoo_config(
+        component_name, config_dir, config_dict)
 
-    # Check if configuration is valid
-    check_config(config_file, config_dict)
+    # Check if configuration is valid without reading the file again
+    check_config(config_file, config_dict, loaded=config)
@@ -29,7 +29,24 @@ def check_environment():
         os.environ['PATTOO_CONFIGDIR'] = '/etc/pattoo'
 
     # Verify configuration directory
-    config_directory = os.environ['PATTOO_CONFIGDIR']
+    check_config_directory(os.environ['PATTOO_CONFIGDIR'])
+
+    # Return
+    path = os.environ['PATTOO_CONFIGDIR']
+    return path
+
+
+def check_config_directory(config_directory):
+    """Check the $PATTOO_CONFIGDIR directory. Die if it doesn't exist.
+
+    Args:
+        config_directory: Value of the $PATTOO_CONFIGDIR environment variable
+
+    Returns:
+        None
+
+    """
+    # Verify configuration directory
     if (os.path.exists(config_directory) is False) or (
             os.path.isdir(config_directory) is False):
         log_message = (
@@ -39,10 +56,6 @@ def check_environment():
         # Must print statement as logging requires a config directory
         log2die_safe(1020, log_message)
 
-    # Return
-    path = os.environ['PATTOO_CONFIGDIR']
-    return path
-
 
 class _GetLog():
     """Class to manage the logging without duplicates."""
@@ -170,6 +170,21 @@ class TestConfigure(unittest.TestCase):
                 config = configure.read_config(file_path, expected)
                 self.assertEqual(config, expected)
 
+    def test__deep_merge(self):
+        """Unittest to test the _deep_merge function."""
+        # Initialize key variables
+        base = {'a': {'b': 1, 'c': 2}, 'd': 3}
+        overlay = {'a': {'c': 4}, 'e': 5}
+        expected = {'a': {'b': 1, 'c': 4}, 'd': 3, 'e': 5}
+
+        # Test
+        result = configure._deep_merge(base, overlay)
+        self.assertEqual(result, expected)
+
+        # Make sure the inputs are left unchanged
+        self.assertEqual(base, {'a': {'b': 1, 'c': 2}, 'd': 3})
+        self.assertEqual(overlay, {'a': {'c': 4}, 'e': 5})
+
     def test_pattoo_config_server(self):
         """Unittest to test the pattoo_config function for the pattoo server."""
         # Initialize key variables
@@ -287,16 +302,90 @@ pattoo_web_api:
             result = configure.read_config(file_path, expected)
             self.assertEqual(result, expected)
 
-            # Test if file gets overwritten
+            # Test that values in the file take priority over the defaults
+            # and that missing defaults are added to the file
             with self.subTest():
-                expected = self.custom_config
+                file_config = expected
+                expected = dict(file_config)
+                expected['encryption'] = self.custom_config['encryption']
+
                 # Create config file
-                configure.pattoo_config('pattoo', temp_dir, expected)
+                configure.pattoo_config('pattoo', temp_dir, self.custom_config)
 
                 # Retrieve config dict from yaml file
-                result = configure.read_config(file_path, expected)
+                result = configure.read_config(file_path, {})
                 self.assertEqual(result, expected)
 
+    @unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+    def test_pattoo_config_duplicate_directories(self, mock_stdout):
+        """Unittest to test pattoo_config with a directory used twice."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = os.path.join(temp_dir, 'shared')
+            config = {
+                'pattoo': {
+                    'cache_directory': directory,
+                    'daemon_directory': '{}{}'.format(directory, os.sep),
+                }
+            }
+
+            # Test that the directory is only created once
+            configure.pattoo_config('pattoo', temp_dir, config)
+            self.assertTrue(os.path.isdir(directory))
+            self.assertEqual(mock_stdout.getvalue().count('Creating:'), 1)
+
+    def test__existing_directories(self):
+        """Unittest to test the _existing_directories function."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            present = os.path.join(temp_dir, 'present')
+            absent = os.path.join(temp_dir, 'absent')
+            orphan = os.path.join(temp_dir, 'absent', 'orphan')
+            os.mkdir(present)
+
+            # Files with the same name are not directories
+            filename = os.path.join(temp_dir, 'file')
+            open(filename, 'w').close()
+
+            # Test
+            expected = {present, temp_dir}
+            result = configure._existing_directories(
+                [present, absent, orphan, filename, temp_dir])
+            self.assertEqual(result, expected)
+
+            # Test paths without a final name to scan for
+            dotted = [
+                os.sep, '{}{}.'.format(temp_dir, os.sep),
+                '{}{}..'.format(temp_dir, os.sep), '{}{}'.format(
+                    present, os.sep)]
+            result = configure._existing_directories(dotted)
+            self.assertEqual(result, set(dotted))
+
+    def test__chown_roots(self):
+        """Unittest to test the _chown_roots function."""
+        # Initialize key variables
+        directories = [
+            '/opt/pattoo/cache', '/opt/pattoo', '/opt/pattoo/', '/var/log',
+            '/var/log/pattoo', '/opt/pattoo-daemon', '/var/run/pattoo']
+        expected = [
+            '/opt/pattoo', '/var/log', '/var/log/pattoo', '/var/run/pattoo',
+            '/opt/pattoo-daemon']
+
+        # Test
+        result = configure._chown_roots(directories)
+        self.assertEqual(sorted(result), sorted(expected))
+
+        # Test a symlinked child whose target is outside its parent
+        with tempfile.TemporaryDirectory() as temp_dir:
+            parent = os.path.join(temp_dir, 'pattoo')
+            target = os.path.join(temp_dir, 'target', 'pattoo')
+            link = os.path.join(parent, 'cache')
+            inside = os.path.join(parent, 'log')
+            os.makedirs(target)
+            os.makedirs(inside)
+            os.symlink(target, link)
+
+            result = configure._chown_roots([parent, link, inside])
+            self.assertEqual(sorted(result), sorted([parent, link]))
+
     # Using mock patch to capture output
     @unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
     def test_check_config(self, mock_stdout):
@@ -340,6 +429,47 @@ OK: Configuration parameter check passed.
             configure.check_config(config_file, config)
             self.assertEqual(mock_stdout.getvalue(), expected)
 
+            # Test with configuration that has already been loaded
+            with self.subTest():
+                missing_file = os.path.join(temp_dir, "missing.yaml")
+                configure.check_config(missing_file, config, loaded=config)
+
+            # Test missing section
+            with self.subTest():
+                with self.assertRaises(SystemExit):
+                    configure.check_config(
+                        config_file, {'pattoo_missing': {}})
+
+            # Test missing parameter
+            with self.subTest():
+                with self.assertRaises(SystemExit):
+                    configure.check_config(
+                        config_file, {'pattoo': {'missing_parameter': 1}})
+
+            # Test secondary keys given as a list
+            with self.subTest():
+                configure.check_config(
+                    config_file, {'pattoo': ['log_directory', 'language']})
+                with self.assertRaises(SystemExit):
+                    configure.check_config(
+                        config_file, {'pattoo': ['missing_parameter']})
+
+            # Test a section without values
+            with self.subTest():
+                empty_file = os.path.join(temp_dir, "empty.yaml")
+                with open(empty_file, 'w') as f_handle:
+                    f_handle.write('pattoo:\n')
+                with self.assertRaises(SystemExit):
+                    configure.check_config(empty_file, config)
+                self.assertIn('[1108]', mock_stdout.getvalue())
+
+            # Test missing keys of mixed types
+            with self.subTest():
+                with self.assertRaises(SystemExit):
+                    configure.check_config(
+                        config_file, {1: {}, 'pattoo_missing': {}})
+                self.assertIn('"1", "pattoo_missing"', mock_stdout.getvalue())
+
     def test_configure_component(self):
         """Unittest to test the configure_component function."""
         # Initialize key variables
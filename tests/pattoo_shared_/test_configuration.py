@@ -5,6 +5,7 @@
 import unittest
 import os
 import sys
+import tempfile
 
 
 # Try to create a working PYTHONPATH
@@ -249,6 +250,68 @@ class TestBasicFunctions(unittest.TestCase):
         result = configuration.agent_config_filename(agent_program)
         self.assertEqual(result, expected)
 
+        # Test with a trailing separator in the configuration directory
+        os.environ['PATTOO_CONFIGDIR'] = '{}{}'.format(
+            _config_directory, os.sep)
+        try:
+            result = configuration.agent_config_filename(agent_program)
+        finally:
+            os.environ['PATTOO_CONFIGDIR'] = _config_directory
+        self.assertEqual(result, expected)
+
+    def test__config_dir(self):
+        """Testing function _config_dir."""
+        # Initialize key values
+        configuration._expanded_config_dir.cache_clear()
+        expected = os.path.expanduser(log.check_environment())
+
+        # Test
+        result = configuration._config_dir()
+        self.assertEqual(result, expected)
+        result = configuration._config_dir()
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            configuration._expanded_config_dir.cache_info().hits, 1)
+
+        # Test with a directory that doesn't exist
+        with tempfile.TemporaryDirectory() as temp_dir:
+            missing = os.path.join(temp_dir, 'missing')
+        with self.assertRaises(SystemExit):
+            _ = configuration._expanded_config_dir(missing)
+
+    def test__config_reader(self):
+        """Testing function _config_reader."""
+        # Initialize key values
+        configuration._load_config_cached.cache_clear()
+        expected = configuration._config_reader('pattoo.yaml')
+
+        # Test that the second read comes from the cache
+        result = configuration._config_reader('pattoo.yaml')
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            configuration._load_config_cached.cache_info().hits, 1)
+
+        # Test that each read returns a separate copy
+        self.assertIsNot(result, expected)
+        result['pattoo']['log_level'] = 'MUTATED'
+        self.assertEqual(configuration.BaseConfig().log_level(), 'debug')
+
+    def test__ensure_dir(self):
+        """Testing function _ensure_dir."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = os.path.join(temp_dir, 'ensured')
+
+            # Test creation
+            configuration._ensure_dir(directory)
+            self.assertTrue(os.path.isdir(directory))
+            self.assertIn(directory, configuration._ENSURED_DIRECTORIES)
+
+            # Test that the directory is not checked a second time
+            os.rmdir(directory)
+            configuration._ensure_dir(directory)
+            self.assertFalse(os.path.isdir(directory))
+            configuration._ENSURED_DIRECTORIES.discard(directory)
+
     def test_get_polling_points(self):
         """Testing function _polling_points."""
         # Initialize key values
@@ -268,6 +331,56 @@ class TestBasicFunctions(unittest.TestCase):
             self.assertEqual(value.address, oids[index])
             self.assertEqual(value.multiplier, 8)
 
+        # Test with bad data
+        data = [
+            'string', ['list'], None, {'multiplier': 8},
+            {'address': '.1.3.6.1.2.1.2.2.1.10'}]
+        result = configuration.get_polling_points(data)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].address, oids[0])
+        self.assertEqual(result[0].multiplier, 1)
+        self.assertEqual(configuration.get_polling_points(None), [])
+
+    def test__flatten(self):
+        """Testing function _flatten."""
+        # Initialize key variables
+        data = {
+            1: {
+                11: '11',
+                12: '12'
+            },
+            2: 'not a dict'
+        }
+        expected = {(1, 11): '11', (1, 12): '12'}
+
+        # Test
+        result = configuration._flatten(data)
+        self.assertEqual(result, expected)
+
+        # Test invalid configuration
+        self.assertIsNone(configuration._flatten(None))
+        self.assertIsNone(configuration._flatten('not a dict'))
+
+    def test_lookup(self):
+        """Testing function lookup."""
+        # Initialize key variables
+        lookup_dict = {(1, 11): '11', (1, 12): '12', (2, 21): '21'}
+
+        # Test all values
+        for (key, sub_key), expected in lookup_dict.items():
+            result = configuration.lookup(key, sub_key, lookup_dict)
+            self.assertEqual(result, expected)
+
+        # Test missing values
+        with self.assertRaises(SystemExit):
+            _ = configuration.lookup(3, 31, lookup_dict)
+        result = configuration.lookup(3, 31, lookup_dict, die=False)
+        self.assertIsNone(result)
+
+        # Test invalid configuration
+        with self.assertRaises(SystemExit):
+            _ = configuration.lookup(1, 11, None)
+
     def test_search(self):
         """Testing function search."""
         # Initialize key variables
@@ -32,6 +32,7 @@ from pattoo_shared.constants import DATA_NONE
 from pattoo_shared.constants import MAX_KEYPAIR_LENGTH
 from pattoo_shared.constants import DATAPOINT_KEYS
 from pattoo_shared.constants import RESERVED_KEYS
+from pattoo_shared.constants import RESERVED_KEYS_SET
 from pattoo_shared.constants import CACHE_KEYS
 
 
@@ -68,6 +69,7 @@ class TestConstants(unittest.TestCase):
              'pattoo_agent_id', 'pattoo_agent_polled_target',
              'pattoo_agent_program', 'pattoo_agent_hostname',
              'pattoo_agent_polling_interval'))
+        self.assertEqual(RESERVED_KEYS_SET, frozenset(RESERVED_KEYS))
         self.assertEqual(
             CACHE_KEYS,
             ('pattoo_agent_id', 'pattoo_datapoints',
@@ -5,6 +5,7 @@
 import unittest
 import os
 import sys
+import tempfile
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -58,6 +59,17 @@ class TestBasicFunctions(unittest.TestCase):
         """Testing function check_environment."""
         pass
 
+    def test_check_config_directory(self):
+        """Testing function check_config_directory."""
+        # Test should not cause script to crash
+        log.check_config_directory(log.check_environment())
+
+        # Test with a directory that doesn't exist
+        with tempfile.TemporaryDirectory() as temp_dir:
+            missing = os.path.join(temp_dir, 'missing')
+        with self.assertRaises(SystemExit):
+            log.check_config_directory(missing)
+
     def test_log2console(self):
         """Testing function log2console."""
         # Test should not cause script to crash